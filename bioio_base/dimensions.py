@@ -2,7 +2,18 @@
 # -*- coding: utf-8 -*-
 
 from collections.abc import Sequence as seq
-from typing import Collection, ItemsView, Sequence, Tuple, Union
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    FrozenSet,
+    ItemsView,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 ###############################################################################
 
@@ -64,6 +75,22 @@ REQUIRED_CHUNK_DIMS = [
 
 
 class Dimensions:
+    __slots__ = (
+        "_order",
+        "_order_set",
+        "_shape",
+        "_dims_shape",
+        "_extras",
+        "_getter_cache",
+        *DEFAULT_DIMENSION_ORDER_LIST_WITH_MOSAIC_TILES_AND_SAMPLES,
+    )
+    _order: str
+    _order_set: FrozenSet[str]
+    _shape: Tuple[int, ...]
+    _dims_shape: Dict[str, int]
+    _extras: Dict[str, int]
+    _getter_cache: Dict[Tuple[str, ...], Callable]
+
     def __init__(self, dims: Collection[str], shape: Tuple[int, ...]):
         """
         A general object for managing the pairing of dimension name and dimension size.
@@ -75,6 +102,11 @@ class Dimensions:
         shape: Tuple[int, ...]
             An ordered tuple of the dimensions sizes to pair with their names.
 
+        Notes
+        -----
+        Dimensions are immutable and hashable. Two Dimensions with the same order and
+        shape compare equal, so they can be used directly as cache keys.
+
         Examples
         --------
         >>> dims = Dimensions("TCZYX", (1, 4, 75, 624, 924))
@@ -83,15 +115,18 @@ class Dimensions:
         """
         # zip(strict=True) only in Python 3.10
         # Check equal length dims and shape
-        if len(dims) != len(shape):
+        n_dims = len(dims)
+        n_shape = len(shape)
+        if n_dims != n_shape:
             raise ValueError(
-                f"Number of dimensions provided ({len(dims)} -- '{dims}') "
-                f"does not match shape size provided ({len(shape)} -- '{shape}')."
+                f"Number of dimensions provided ({n_dims} -- '{dims}') "
+                f"does not match shape size provided ({n_shape} -- '{shape}')."
             )
 
         # Make dims a string
+        # Strings (the common case) skip the per-character validation entirely
         if not isinstance(dims, str):
-            if any([len(c) != 1 for c in dims]):
+            if any(len(c) != 1 for c in dims):
                 raise ValueError(
                     f"When providing a list of dimension strings, "
                     f"each dimension may only be a single character long "
@@ -100,13 +135,27 @@ class Dimensions:
             dims = "".join(dims)
 
         # Store order and shape
-        self._order = dims
-        self._shape = shape
+        # __setattr__ is blocked to keep instances immutable (and hashable)
+        # so internal state is written with object.__setattr__
+        _set = object.__setattr__
+        _set(self, "_order", dims)
+        _set(self, "_order_set", frozenset(dims))
+        _set(self, "_shape", tuple(shape))
 
         # Create attributes
-        self._dims_shape = dict(zip(dims, shape))
-        for dim, size in self._dims_shape.items():
-            setattr(self, dim, size)
+        # Standard dimensions are stored in slots, anything else falls back to
+        # the _extras lookup in __getattr__
+        dims_shape = dict(zip(dims, shape))
+        extras: Dict[str, int] = {}
+        _set(self, "_dims_shape", dims_shape)
+        _set(self, "_extras", extras)
+        _set(self, "_getter_cache", {})
+        for dim, size in dims_shape.items():
+            set_slot = _DIM_SLOT_SETTERS.get(dim)
+            if set_slot is None:
+                extras[dim] = size
+            else:
+                set_slot(self, size)
 
     @property
     def order(self) -> str:
@@ -138,28 +187,70 @@ class Dimensions:
     def __repr__(self) -> str:
         return str(self)
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Dimensions):
+            return NotImplemented
+        return self._order == other._order and self._shape == other._shape
+
+    def __hash__(self) -> int:
+        return hash((self._order, self._shape))
+
+    def __reduce__(self) -> Tuple[type, Tuple[str, Tuple[int, ...]]]:
+        return (Dimensions, (self._order, self._shape))
+
+    def __setattr__(self, __name: str, __value: Any) -> None:
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __delattr__(self, __name: str) -> None:
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
     def __getitem__(self, key: Union[str, Sequence[str]]) -> Tuple[int, ...]:
         if isinstance(key, str):
-            if key not in self._order:
-                raise IndexError(f"{key} not in {self._order}")
-            return (self._dims_shape[key],)
-        elif isinstance(key, seq) and all(isinstance(k, str) for k in key):
-            invalid_dims = []
-            for k in key:
-                if k not in self._order:
-                    invalid_dims.append(k)
-            if len(invalid_dims) == 0:
-                return tuple(self._dims_shape[k] for k in key)
-            else:
-                raise IndexError(f"{', '.join(invalid_dims)} not in {self._order}")
+            try:
+                return (self._dims_shape[key],)
+            except KeyError:
+                raise IndexError(f"{key} not in {self._order}") from None
+        elif isinstance(key, seq):
+            # Validated keys are cached as an itemgetter so repeat lookups
+            # are a single C-level call
+            key = tuple(key)
+            getter = self._getter_cache.get(key)
+            if getter is None:
+                if not all(isinstance(k, str) for k in key):
+                    raise TypeError(
+                        f"Key must be a string or list of strings but got {key}"
+                    )
+                if not self._order_set.issuperset(key):
+                    invalid_dims = [k for k in key if k not in self._order_set]
+                    raise IndexError(f"{', '.join(invalid_dims)} not in {self._order}")
+                if len(key) == 0:
+                    return ()
+
+                getter = self._getter_cache[key] = itemgetter(*key)
+
+            # itemgetter returns a bare value rather than a tuple for a single key
+            if len(key) == 1:
+                return (getter(self._dims_shape),)
+            return getter(self._dims_shape)
         else:
             raise TypeError(
                 f"Key must be a string or list of strings but got type {type(key)}"
             )
 
-    def __setattr__(self, __name: str, __value: int) -> None:
-        super().__setattr__(__name, __value)
-
     def __getattr__(self, __name: str) -> int:
+        # Only called when the slot lookup failed
         # TODO: Py310 __match_args__ for better typing
-        return super().__getattribute__(__name)
+        try:
+            return object.__getattribute__(self, "_extras")[__name]
+        except KeyError:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{__name}'"
+            ) from None
+
+
+# Bound slot descriptor setters, writes straight into the slot without going
+# through attribute lookup
+_DIM_SLOT_SETTERS: Dict[str, Callable[[Dimensions, int], None]] = {
+    dim: getattr(Dimensions, dim).__set__
+    for dim in DEFAULT_DIMENSION_ORDER_LIST_WITH_MOSAIC_TILES_AND_SAMPLES
+}
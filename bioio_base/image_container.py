@@ -2,14 +2,17 @@
 # -*- coding: utf-8 -*-
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
 
-import dask.array as da
-import numpy as np
-import xarray as xr
+if TYPE_CHECKING:
+    import dask.array as da
+    import numpy as np
+    import xarray as xr
+
+    from .types import ImageLike
 
 from .dimensions import Dimensions
-from .types import ImageLike, PhysicalPixelSizes
+from .types import PhysicalPixelSizes
 
 ###############################################################################
 
@@ -17,7 +20,7 @@ from .types import ImageLike, PhysicalPixelSizes
 class ImageContainer(ABC):
     def __init__(
         self,
-        image: ImageLike,
+        image: "ImageLike",
         reader: Optional[Type["ImageContainer"]] = None,
         reconstruct_mosaic: bool = True,
         fs_kwargs: Dict[str, Any] = {},
@@ -60,27 +63,27 @@ class ImageContainer(ABC):
 
     @property
     @abstractmethod
-    def xarray_dask_data(self) -> xr.DataArray:
+    def xarray_dask_data(self) -> "xr.DataArray":
         pass
 
     @property
     @abstractmethod
-    def xarray_data(self) -> xr.DataArray:
+    def xarray_data(self) -> "xr.DataArray":
         pass
 
     @property
     @abstractmethod
-    def dask_data(self) -> da.Array:
+    def dask_data(self) -> "da.Array":
         pass
 
     @property
     @abstractmethod
-    def data(self) -> np.ndarray:
+    def data(self) -> "np.ndarray":
         pass
 
     @property
     @abstractmethod
-    def dtype(self) -> np.dtype:
+    def dtype(self) -> "np.dtype":
         pass
 
     @property
@@ -96,13 +99,13 @@ class ImageContainer(ABC):
     @abstractmethod
     def get_image_dask_data(
         self, dimension_order_out: Optional[str] = None, **kwargs: Any
-    ) -> da.Array:
+    ) -> "da.Array":
         pass
 
     @abstractmethod
     def get_image_data(
         self, dimension_order_out: Optional[str] = None, **kwargs: Any
-    ) -> np.ndarray:
+    ) -> "np.ndarray":
         pass
 
     @property
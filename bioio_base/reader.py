@@ -2,14 +2,24 @@
 # -*- coding: utf-8 -*-
 
 from abc import ABC, abstractmethod
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from functools import lru_cache
+from pathlib import Path, PosixPath, WindowsPath
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 import dask.array as da
 import numpy as np
 import xarray as xr
 from fsspec.spec import AbstractFileSystem
-from ome_types import OME
 
 from . import constants, exceptions, transforms, types
 from .dimensions import DEFAULT_DIMENSION_ORDER, DimensionNames, Dimensions
@@ -17,6 +27,31 @@ from .image_container import ImageContainer
 from .io import pathlike_to_fs
 from .types import PhysicalPixelSizes
 
+if TYPE_CHECKING:
+    # ome_types is slow to import and only needed by readers that produce OME
+    from ome_types import OME
+
+###############################################################################
+
+
+# Exact type lookup for the common image inputs (is the image a path or not)
+# Subclasses of these types fall back to isinstance checks
+_IMAGE_TYPE_IS_PATH: Dict[type, bool] = {
+    str: True,
+    PosixPath: True,
+    WindowsPath: True,
+    list: False,
+    np.ndarray: False,
+    da.core.Array: False,
+    xr.DataArray: False,
+}
+
+
+@lru_cache(maxsize=None)
+def _default_dim_order(ndim: int) -> str:
+    return DEFAULT_DIMENSION_ORDER[len(DEFAULT_DIMENSION_ORDER) - ndim :]
+
+
 ###############################################################################
 
 
@@ -41,13 +76,24 @@ class Reader(ImageContainer, ABC):
 
     _xarray_dask_data: Optional[xr.DataArray] = None
     _xarray_data: Optional[xr.DataArray] = None
+    _numpy_data: Optional[np.ndarray] = None
     _mosaic_xarray_dask_data: Optional[xr.DataArray] = None
     _mosaic_xarray_data: Optional[xr.DataArray] = None
     _dims: Optional[Dimensions] = None
+    _dim_order: Optional[str] = None
+    _has_mosaic: Optional[bool] = None
+    _channel_names: Optional[Tuple[str, ...]] = None
     _metadata: Optional[Any] = None
+    _ome_metadata: Optional["OME"] = None
     _scenes: Optional[Tuple[str, ...]] = None
+    _scene_index_map: Optional[Dict[str, int]] = None
     _current_scene_index: int = 0
     _current_resolution_level: int = 0
+    _prefetch_cache: Optional[Dict[Tuple[int, Optional[int]], bytes]] = None
+    # Cached attributes that hold for every scene in the file (file level metadata
+    # for example), these are kept when switching scenes
+    # The OME model always describes every image (scene) in the file
+    _SCENE_INDEPENDENT_CACHES: FrozenSet[str] = frozenset({"_ome_metadata"})
     # Do not default because they aren't used by all readers
     _fs: AbstractFileSystem
     _path: str
@@ -110,11 +156,23 @@ class Reader(ImageContainer, ABC):
         TypeError
             Invalid type provided to image parameter.
         """
+        is_path = _IMAGE_TYPE_IS_PATH.get(type(image))
+        if is_path is None:
+            if isinstance(image, (str, Path)):
+                is_path = True
+            elif isinstance(image, (list, np.ndarray, da.core.Array, xr.DataArray)):
+                is_path = False
+            else:
+                raise TypeError(
+                    f"Reader only accepts types: {types.ImageLike}. "
+                    f"Received: '{type(image)}'."
+                )
+
         # Check path
-        if isinstance(image, (str, Path)):
+        if is_path:
             # Expand details of provided image
             fs, path = pathlike_to_fs(
-                image,
+                cast(types.PathLike, image),
                 enforce_exists=True,
                 fs_kwargs=fs_kwargs,
             )
@@ -122,13 +180,7 @@ class Reader(ImageContainer, ABC):
             return cls._is_supported_image(fs, path, **kwargs)
 
         # Special cases
-        if isinstance(image, (list, np.ndarray, da.core.Array, xr.DataArray)):
-            return cls._is_supported_image(image, **kwargs)
-
-        # Raise because none of the above returned
-        raise TypeError(
-            f"Reader only accepts types: {types.ImageLike}. Received: '{type(image)}'."
-        )
+        return cls._is_supported_image(image, **kwargs)
 
     def __init__(self, image: Any, **kwargs: Any):
         pass
@@ -151,7 +203,59 @@ class Reader(ImageContainer, ABC):
         dim_order: str
             The guessed dimension order.
         """
-        return DEFAULT_DIMENSION_ORDER[len(DEFAULT_DIMENSION_ORDER) - len(shape) :]
+        return _default_dim_order(len(shape))
+
+    def _prefetch(self, ranges: List[Tuple[int, Optional[int]]]) -> List[bytes]:
+        """
+        Read multiple byte ranges of the file in a single filesystem request.
+
+        Readers whose header, footer, and index reads are small and known ahead of
+        time can call this from `_read_delayed` to avoid a round trip per read on
+        remote filesystems.
+
+        Parameters
+        ----------
+        ranges: List[Tuple[int, Optional[int]]]
+            The (start, end) byte ranges to read from `self._path` using `self._fs`.
+            Follows fsspec `cat_file` semantics: a negative start is relative to the
+            end of the file and an end of None reads to the end of the file.
+
+        Returns
+        -------
+        data: List[bytes]
+            The bytes for each requested range, in the same order as ranges.
+
+        Notes
+        -----
+        Ranges are cached for the lifetime of the reader (the file contents do not
+        change between scenes or resolution levels) so repeat requests do not
+        touch the filesystem.
+        """
+        if self._prefetch_cache is None:
+            self._prefetch_cache = {}
+
+        missing = [r for r in dict.fromkeys(ranges) if r not in self._prefetch_cache]
+        if len(missing) > 0:
+            # Older fsspec versions do not provide cat_ranges
+            if hasattr(self._fs, "cat_ranges"):
+                fetched = self._fs.cat_ranges(
+                    [self._path] * len(missing),
+                    [start for start, _ in missing],
+                    [end for _, end in missing],
+                )
+            else:
+                fetched = [
+                    self._fs.cat_file(self._path, start, end) for start, end in missing
+                ]
+
+            # cat_ranges returns errors in place of bytes by default
+            for result in fetched:
+                if isinstance(result, Exception):
+                    raise result
+
+            self._prefetch_cache.update(zip(missing, fetched))
+
+        return [self._prefetch_cache[r] for r in ranges]
 
     @property
     @abstractmethod
@@ -225,24 +329,67 @@ class Reader(ImageContainer, ABC):
         resolution_level_dims: Dict[int, Tuple[int, ...]]
             resolution level dictionary of shapes.
         """
-        initial_resolution_level = self.current_resolution_level
-        resolution_level_dims = {}
+        return {level: self._shape_for_level(level) for level in self.resolution_levels}
+
+    def _shape_for_level(self, resolution_level: int) -> Tuple[int, ...]:
+        """
+        Get the image shape at a resolution level of the current scene.
 
-        for level in self.resolution_levels:
-            self.set_resolution_level(level)
-            resolution_level_dims[level] = self.shape
-        self.set_resolution_level(initial_resolution_level)
+        Can and should be overwritten by inhereting Reader classes that can read the
+        shape of each level directly from the file (i.e. pyramid metadata) without
+        switching resolution levels.
 
-        return resolution_level_dims
+        Parameters
+        ----------
+        resolution_level: int
+            The resolution level to get the shape for.
+
+        Returns
+        -------
+        shape: Tuple[int, ...]
+            Tuple of the image array's dimensions at the resolution level.
+
+        Notes
+        -----
+        The default implementation switches to the requested resolution level and
+        back, which discards any data already read for the current resolution level.
+        The current resolution level is answered without switching.
+        """
+        if resolution_level == self.current_resolution_level:
+            return self.shape
+
+        initial_resolution_level = self.current_resolution_level
+        self.set_resolution_level(resolution_level)
+        try:
+            return self.shape
+        finally:
+            self.set_resolution_level(initial_resolution_level)
 
     def _reset_self(self) -> None:
         # Reset the data stored in the Reader object
         self._xarray_dask_data = None
         self._xarray_data = None
+        self._numpy_data = None
         self._mosaic_xarray_dask_data = None
         self._mosaic_xarray_data = None
         self._dims = None
+        self._dim_order = None
+        self._has_mosaic = None
+        self._channel_names = None
         self._metadata = None
+        self._ome_metadata = None
+
+    def _reset_scene(self) -> None:
+        # Reset the data stored in the Reader object for a new scene while keeping
+        # any caches the reader marks as shared by all scenes
+        kept = {
+            name: getattr(self, name)
+            for name in self._SCENE_INDEPENDENT_CACHES
+            if hasattr(self, name)
+        }
+        self._reset_self()
+        for name, value in kept.items():
+            setattr(self, name, value)
 
     def set_scene(self, scene_id: Union[str, int]) -> None:
         """
@@ -263,25 +410,37 @@ class Reader(ImageContainer, ABC):
         """
         # Route to int or str setting
         if isinstance(scene_id, str):
-            # Only need to run when the scene id is different from current scene
-            if scene_id != self.current_scene:
-                # Validate scene id
-                if scene_id not in self.scenes:
-                    raise IndexError(
-                        f"Scene id: '{scene_id}' "
-                        f"is not present in available image scenes: {self.scenes}"
-                    )
+            # Build the scene id lookup once, scenes do not change for a file
+            # Keep the first index for duplicated scene ids
+            if self._scene_index_map is None:
+                self._scene_index_map = {}
+                for index, scene in enumerate(self.scenes):
+                    self._scene_index_map.setdefault(scene, index)
+
+            # Validate scene id
+            scene_index = self._scene_index_map.get(scene_id)
+            if scene_index is None:
+                raise IndexError(
+                    f"Scene id: '{scene_id}' "
+                    f"is not present in available image scenes: {self.scenes}"
+                )
 
+            # Only need to run when the scene id is different from current scene
+            # Compare indices first so repeat calls skip touching the scenes
+            if (
+                scene_index != self._current_scene_index
+                and scene_id != self.current_scene
+            ):
                 # Update current scene
-                self._current_scene_index = self.scenes.index(scene_id)
+                self._current_scene_index = scene_index
 
                 # Reset self for future read
-                self._reset_self()
+                self._reset_scene()
 
         # Handle index
         elif isinstance(scene_id, int):
             # Only need to run when scene index is different from current scene
-            if scene_id != self.current_scene_index:
+            if scene_id != self._current_scene_index:
                 # Validate scene index
                 if scene_id >= len(self.scenes):
                     raise IndexError(
@@ -294,7 +453,7 @@ class Reader(ImageContainer, ABC):
                 self._current_scene_index = scene_id
 
                 # Reset set for future read
-                self._reset_self()
+                self._reset_scene()
 
         else:
             raise TypeError(
@@ -372,6 +531,20 @@ class Reader(ImageContainer, ABC):
         coordinate array the respective channel coordinate values.
         """
 
+    def _is_mosaic(self) -> bool:
+        """
+        Whether or not the current scene has a MosaicTile dimension.
+
+        Returns
+        -------
+        is_mosaic: bool
+            True if the MosaicTile dimension is present in the current dims.
+        """
+        if self._has_mosaic is None:
+            self._has_mosaic = DimensionNames.MosaicTile in self.dims.order
+
+        return self._has_mosaic
+
     def _get_stitched_dask_mosaic(self) -> xr.DataArray:
         """
         Stitch all mosaic tiles back together and return as a single xr.DataArray with
@@ -412,6 +585,13 @@ class Reader(ImageContainer, ABC):
         ------
         NotImplementedError
             Reader or format doesn't support reconstructing mosaic tiles.
+
+        Notes
+        -----
+        Implementations that paste tiles into a preallocated output should allocate
+        it with np.zeros (or np.full for a non-zero background) and skip tiles
+        where `not tile.any()`, the background positions of sparse mosaic layouts
+        then cost no writes.
         """
         raise NotImplementedError(
             "This reader does not support reconstructing mosaic images."
@@ -440,14 +620,22 @@ class Reader(ImageContainer, ABC):
         """
         if self._xarray_data is None:
             self._xarray_data = self._read_immediate()
-
-            # Remake the delayed xarray dataarray object using a rechunked dask array
-            # from the just retrieved in-memory xarray dataarray
-            self._xarray_dask_data = xr.DataArray(
-                da.from_array(self._xarray_data.data),
-                dims=self._xarray_data.dims,
-                coords=self._xarray_data.coords,
-                attrs=self._xarray_data.attrs,
+            self._numpy_data = self._xarray_data.data
+
+            # Remake the delayed xarray dataarray object using a dask array wrapping
+            # the just retrieved in-memory xarray dataarray
+            # The data is already in memory so splitting it into multiple chunks
+            # offers no read parallelism, keep it as a single block
+            # A shallow copy with new data shares the dims, coords, and attrs
+            # (non-index coords stay numpy rather than being chunked)
+            data = self._numpy_data
+            self._xarray_dask_data = self._xarray_data.copy(
+                deep=False,
+                data=da.from_array(
+                    data,
+                    chunks=-1,
+                    meta=np.empty((0,) * data.ndim, dtype=data.dtype),
+                ),
             )
 
         return self._xarray_data
@@ -470,7 +658,10 @@ class Reader(ImageContainer, ABC):
         data: np.ndarray
             The image as a numpy array with native dimension ordering.
         """
-        return self.xarray_data.data
+        if self._numpy_data is None:
+            self._numpy_data = self.xarray_data.data
+
+        return self._numpy_data
 
     @property
     def mosaic_xarray_dask_data(self) -> xr.DataArray:
@@ -491,7 +682,7 @@ class Reader(ImageContainer, ABC):
         that each tile is a dask array chunk.
         """
         # Catch non-mosaic images
-        if DimensionNames.MosaicTile not in self.dims.order:
+        if not self._is_mosaic():
             raise exceptions.InvalidDimensionOrderingError(
                 "Cannot create stitched mosaic image for array without tiles available."
             )
@@ -520,7 +711,7 @@ class Reader(ImageContainer, ABC):
         Very large images should use `mosaic_xarray_dask_data` to avoid seg-faults.
         """
         # Catch non-mosaic images
-        if DimensionNames.MosaicTile not in self.dims.order:
+        if not self._is_mosaic():
             raise exceptions.InvalidDimensionOrderingError(
                 "Cannot create stitched mosaic image for array without tiles available."
             )
@@ -599,7 +790,9 @@ class Reader(ImageContainer, ABC):
             Object with the paired dimension names and their sizes.
         """
         if self._dims is None:
-            self._dims = Dimensions(dims=self.xarray_dask_data.dims, shape=self.shape)
+            data = self.xarray_dask_data
+            self._dims = Dimensions(dims=data.dims, shape=data.shape)
+            self._dim_order = self._dims.order
 
         return self._dims
 
@@ -675,7 +868,7 @@ class Reader(ImageContainer, ABC):
         # Transform and return
         return transforms.reshape_data(
             data=self.dask_data,
-            given_dims=self.dims.order,
+            given_dims=self._dim_order or self.dims.order,
             return_dims=dimension_order_out,
             **kwargs,
         )
@@ -684,7 +877,7 @@ class Reader(ImageContainer, ABC):
         self, dimension_order_out: Optional[str] = None, **kwargs: Any
     ) -> np.ndarray:
         """
-        Read the image as a numpy array then return specific dimension image data.
+        Get specific dimension image data out of an image as a numpy array.
 
         Parameters
         ----------
@@ -742,20 +935,35 @@ class Reader(ImageContainer, ABC):
         -----
         * If a requested dimension is not present in the data the dimension is
           added with a depth of 1.
-        * This will preload the entire image before returning the requested data.
+        * If no dimension_order_out is provided, this will read the entire image into
+          memory. Otherwise, if the image has not already been read into memory, only
+          the requested selection is read (from the delayed array) and the image is
+          not kept in memory afterwards.
 
         See `aicsimageio.transforms.reshape_data` for more details.
         """
-        # If no out orientation, simply return current data as dask array
+        # If no out orientation, simply return current data as numpy array
         if dimension_order_out is None:
             return self.data
 
-        # Transform and return
-        return transforms.reshape_data(
-            data=self.data,
-            given_dims=self.dims.order,
-            return_dims=dimension_order_out,
-            **kwargs,
+        # Image already in memory, select from it directly
+        if self._xarray_data is not None:
+            return transforms.reshape_data(
+                data=self.data,
+                given_dims=self._dim_order or self.dims.order,
+                return_dims=dimension_order_out,
+                **kwargs,
+            )
+
+        # Select from the delayed array so only the requested chunks are read
+        # np.asarray computes the delayed selection
+        return np.asarray(
+            transforms.reshape_data(
+                data=self.dask_data,
+                given_dims=self._dim_order or self.dims.order,
+                return_dims=dimension_order_out,
+                **kwargs,
+            )
         )
 
     @property
@@ -774,19 +982,16 @@ class Reader(ImageContainer, ABC):
             `unprocessed` and `processed` that you can then select.
         """
         if self._metadata is None:
-            if constants.METADATA_PROCESSED in self.xarray_dask_data.attrs:
-                self._metadata = self.xarray_dask_data.attrs[
-                    constants.METADATA_PROCESSED
-                ]
+            attrs = self.xarray_dask_data.attrs
+            if constants.METADATA_PROCESSED in attrs:
+                self._metadata = attrs[constants.METADATA_PROCESSED]
             else:
-                self._metadata = self.xarray_dask_data.attrs[
-                    constants.METADATA_UNPROCESSED
-                ]
+                self._metadata = attrs[constants.METADATA_UNPROCESSED]
 
         return self._metadata
 
     @property
-    def ome_metadata(self) -> OME:
+    def ome_metadata(self) -> "OME":
         """
         Returns
         -------
@@ -795,6 +1000,30 @@ class Reader(ImageContainer, ABC):
             This likely isn't a complete transformation but is guarenteed to
             be a valid transformation.
 
+        Raises
+        ------
+        NotImplementedError
+            No metadata transformer available.
+
+        Notes
+        -----
+        The transformed metadata is cached, readers should implement
+        `_get_ome_metadata` rather than overriding this property.
+        """
+        if self._ome_metadata is None:
+            self._ome_metadata = self._get_ome_metadata()
+
+        return self._ome_metadata
+
+    def _get_ome_metadata(self) -> "OME":
+        """
+        Transform the original metadata into the OME specification.
+
+        Returns
+        -------
+        metadata: OME
+            The transformed metadata for all scenes in the file.
+
         Raises
         ------
         NotImplementedError
@@ -811,10 +1040,19 @@ class Reader(ImageContainer, ABC):
             Using available metadata, the list of strings representing channel names.
             If no channel dimension present in the data, returns None.
         """
-        if DimensionNames.Channel in self.xarray_dask_data.dims:
-            return list(self.xarray_dask_data[DimensionNames.Channel].values)
+        if self._channel_names is None:
+            data = self.xarray_dask_data
+            if DimensionNames.Channel not in data.dims:
+                return None
 
-        return None
+            # Read the coordinate values directly, only dimensions without a
+            # coordinate need xarray to build the default index
+            coord = data.coords.get(DimensionNames.Channel)
+            if coord is None:
+                coord = data[DimensionNames.Channel]
+            self._channel_names = tuple(coord.values)
+
+        return list(self._channel_names)
 
     @staticmethod
     def _generate_coord_array(
@@ -844,8 +1082,18 @@ class Reader(ImageContainer, ABC):
         it was causing errors. To solve, we generate the range with ints and then
         multiply by a float across the entire range to get the proper coords.
         See: https://github.com/AllenCellModeling/aicsimageio/issues/249
+
+        The range is generated directly in the result dtype and scaled in place to
+        avoid allocating a second array for the product. Integer valued floats are
+        exact so the result is identical to multiplying an integer range.
         """
-        return np.arange(start, stop) * step_size
+        # Use the dtype the range times step_size product would have, probed with
+        # a range of at most one element so the full range is only built once
+        probe = np.arange(start, stop, stop - start if stop > start else 1)
+        dtype = np.result_type(probe, step_size)
+        coords = np.arange(start, stop, dtype=dtype)
+        coords *= step_size
+        return coords
 
     @property
     def physical_pixel_sizes(self) -> PhysicalPixelSizes:
@@ -933,8 +1181,11 @@ class Reader(ImageContainer, ABC):
             The dimensions for each tile in the mosaic image.
             If the image is not a mosaic image, returns None.
         """
-        if DimensionNames.MosaicTile in self.dims.order:
-            return Dimensions("YX", (self.dims.Y, self.dims.X))
+        if self._is_mosaic():
+            dims = self.dims
+            return Dimensions(
+                "YX", dims[DimensionNames.SpatialY, DimensionNames.SpatialX]
+            )
 
         return None
 
@@ -1,20 +1,131 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from typing import Any, List, Optional, Tuple, Type, Union
+import ctypes
+import os
+import sys
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple, Type, Union
 
+import dask
 import numpy as np
-from distributed.protocol import deserialize, serialize
+import xarray as xr
 from fsspec.implementations.local import LocalFileSystem
-from psutil import Process
 from xarray.testing import assert_equal
 
 from .image_container import ImageContainer
 from .reader import Reader
 from .types import PathLike
 
+if TYPE_CHECKING:
+    # psutil and distributed are only imported by the checks that use them
+    from psutil import Process
+
 ###############################################################################
 
+_PROCESS: Optional["Process"] = None
+
+###############################################################################
+
+
+def _load_memcmp() -> Optional[Callable[[int, int, int], int]]:
+    try:
+        libc = ctypes.cdll.msvcrt if sys.platform == "win32" else ctypes.CDLL(None)
+        memcmp = libc.memcmp
+    except (AttributeError, OSError):
+        return None
+
+    memcmp.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t]
+    memcmp.restype = ctypes.c_int
+    return memcmp
+
+
+_MEMCMP = _load_memcmp()
+
+###############################################################################
+
+
+def _current_process() -> "Process":
+    # Reuse the same psutil handle between checks, recreate it after a fork
+    global _PROCESS
+    if _PROCESS is None or _PROCESS.pid != os.getpid():
+        from psutil import Process
+
+        _PROCESS = Process()
+
+    return _PROCESS
+
+
+def _is_same_view(a: np.ndarray, b: np.ndarray) -> bool:
+    # Arrays starting at the same address with the same layout read the exact
+    # same bytes and are equal without comparing any values
+    return (
+        isinstance(a, np.ndarray)
+        and isinstance(b, np.ndarray)
+        and a.shape == b.shape
+        and a.dtype == b.dtype
+        and a.strides == b.strides
+        and a.__array_interface__["data"][0] == b.__array_interface__["data"][0]
+    )
+
+
+def _buffer_equal(a: np.ndarray, b: np.ndarray) -> bool:
+    # Byte for byte comparison of contiguous buffers with the C library memcmp
+    # Byte equal arrays are always equal, a False result only means that a
+    # value comparison is needed (-0.0 and 0.0, non-contiguous inputs, etc.)
+    if (
+        _MEMCMP is None
+        or a.shape != b.shape
+        or a.dtype != b.dtype
+        or a.dtype.hasobject
+        or not a.flags.c_contiguous
+        or not b.flags.c_contiguous
+    ):
+        return False
+
+    return _MEMCMP(a.ctypes.data, b.ctypes.data, a.nbytes) == 0
+
+
+def _assert_array_equal_fast(a: np.ndarray, b: np.ndarray) -> None:
+    # np.array_equal is a single vectorized comparison, only build the detailed
+    # numpy.testing failure message when that does not match
+    # (also covers NaNs and differing dtypes which assert_array_equal allows)
+    if _is_same_view(a, b):
+        return
+    if a.shape == b.shape and a.dtype == b.dtype and np.array_equal(a, b):
+        return
+
+    np.testing.assert_array_equal(a, b)
+
+
+def _arrays_differ(a: np.ndarray, b: np.ndarray) -> bool:
+    # Shapes that do not match always differ, otherwise compare a small leading
+    # sample first since different scenes usually differ right away
+    # NaNs in the same positions count as equal, matching assert_array_equal
+    if a.shape != b.shape:
+        return True
+
+    equal_nan = a.dtype.kind in "fc" and b.dtype.kind in "fc"
+    head = min(a.size, 1024)
+    if not np.array_equal(a.flat[:head], b.flat[:head], equal_nan=equal_nan):
+        return True
+
+    return not np.array_equal(a, b, equal_nan=equal_nan)
+
+
+def _xr_equal_fast(a: xr.DataArray, b: xr.DataArray) -> bool:
+    # In-memory data arrays with matching dims and coords whose buffers are
+    # byte equal, dask backed data or a False result needs the full xarray
+    # comparison
+    if (
+        a.dims != b.dims
+        or not isinstance(a.data, np.ndarray)
+        or not isinstance(b.data, np.ndarray)
+        or not _buffer_equal(a.data, b.data)
+    ):
+        return False
+
+    return a.coords.to_dataset().equals(b.coords.to_dataset())
+
 
 def check_local_file_not_open(image_container: ImageContainer) -> None:
     if not hasattr(image_container, "_fs") or not hasattr(image_container, "_path"):
@@ -34,23 +145,31 @@ def check_local_file_not_open(image_container: ImageContainer) -> None:
 
     # Check that there are no open file pointers
     if isinstance(image_container._fs, LocalFileSystem):
-        proc = Process()
-        assert str(image_container._path) not in [f.path for f in proc.open_files()]
+        path = os.fspath(image_container._path)
+        for open_file in _current_process().open_files():
+            assert open_file.path != path, f"File left open: {path}"
 
 
 def check_can_serialize_image_container(image_container: ImageContainer) -> None:
+    from distributed.protocol import deserialize, serialize
+
     # Dump and reconstruct
-    reconstructed = deserialize(*serialize(image_container))
+    # Copy the frames, distributed hands back views of the original array buffers
+    # which would make the reconstructed data alias the original
+    header, frames = serialize(image_container)
+    reconstructed = deserialize(header, [bytes(frame) for frame in frames])
 
     # Assert primary attrs are equal
     if image_container.xarray_data is None:
         assert reconstructed.xarray_data is None
-    else:
+    elif not _xr_equal_fast(image_container.xarray_data, reconstructed.xarray_data):
         assert_equal(image_container.xarray_data, reconstructed.xarray_data)
 
     if image_container.xarray_dask_data is None:
         assert reconstructed.xarray_dask_data is None
-    else:
+    elif not _xr_equal_fast(
+        image_container.xarray_dask_data, reconstructed.xarray_dask_data
+    ):
         assert_equal(image_container.xarray_dask_data, reconstructed.xarray_dask_data)
 
 
@@ -93,31 +212,41 @@ def run_image_container_checks(
     assert image_container.current_resolution_level == expected_current_resolution_level
 
     # Check basics
-    assert image_container.shape == expected_shape
-    assert image_container.dtype == expected_dtype
-    assert image_container.dims.order == expected_dims_order
-    assert image_container.dims.shape == expected_shape
-    assert image_container.channel_names == expected_channel_names
-    assert image_container.physical_pixel_sizes == expected_physical_pixel_sizes
+    # Compare all at once, the labelled differences are only built on failure
+    dims = image_container.dims
+    checks = (
+        ("shape", image_container.shape, expected_shape),
+        ("dtype", image_container.dtype, expected_dtype),
+        ("dims.order", dims.order, expected_dims_order),
+        ("dims.shape", dims.shape, expected_shape),
+        ("channel_names", image_container.channel_names, expected_channel_names),
+        (
+            "physical_pixel_sizes",
+            image_container.physical_pixel_sizes,
+            expected_physical_pixel_sizes,
+        ),
+    )
+    actual = tuple(check[1] for check in checks)
+    expected = tuple(check[2] for check in checks)
+    assert actual == expected, [check for check in checks if check[1] != check[2]]
     assert isinstance(image_container.metadata, expected_metadata_type)
 
     # Read different chunks
-    zyx_chunk_from_delayed = image_container.get_image_dask_data("ZYX").compute()
-    cyx_chunk_from_delayed = image_container.get_image_dask_data("CYX").compute()
+    # Computed together so shared tasks (block reads) run once and in parallel
+    zyx_chunk_from_delayed, cyx_chunk_from_delayed = dask.compute(
+        image_container.get_image_dask_data("ZYX"),
+        image_container.get_image_dask_data("CYX"),
+    )
 
     # Read in mem then pull chunks
+    # get_image_data only selects from in-memory data once the image is read
+    image_container.data
     zyx_chunk_from_mem = image_container.get_image_data("ZYX")
     cyz_chunk_from_mem = image_container.get_image_data("CYX")
 
     # Compare chunk reads
-    np.testing.assert_array_equal(
-        zyx_chunk_from_delayed,
-        zyx_chunk_from_mem,
-    )
-    np.testing.assert_array_equal(
-        cyx_chunk_from_delayed,
-        cyz_chunk_from_mem,
-    )
+    _assert_array_equal_fast(zyx_chunk_from_delayed, zyx_chunk_from_mem)
+    _assert_array_equal_fast(cyx_chunk_from_delayed, cyz_chunk_from_mem)
 
     # Check that the shape and dtype are expected after reading in full
     assert image_container.data.shape == expected_shape
@@ -151,7 +280,8 @@ def run_reader_mosaic_checks(
 
     # Compare
     assert from_tiles_stitched_data.shape == already_stitched_data.shape
-    np.testing.assert_array_equal(from_tiles_stitched_data, already_stitched_data)
+    if not _buffer_equal(from_tiles_stitched_data, already_stitched_data):
+        _assert_array_equal_fast(from_tiles_stitched_data, already_stitched_data)
 
 
 def run_image_file_checks(
@@ -258,12 +388,9 @@ def run_multi_scene_image_read_checks(
 
     # Check that the first and second scene are not the same
     if not allow_same_scene_data:
-        np.testing.assert_raises(
-            AssertionError,
-            np.testing.assert_array_equal,
-            first_scene_data,
-            second_scene_data,
-        )
+        assert _arrays_differ(
+            first_scene_data, second_scene_data
+        ), "First and second scene data are the same"
 
     check_local_file_not_open(image_container)
     check_can_serialize_image_container(image_container)
@@ -327,12 +454,9 @@ def run_no_scene_name_image_read_checks(
 
     # Check that the first and second scene are not the same
     if not allow_same_scene_data:
-        np.testing.assert_raises(
-            AssertionError,
-            np.testing.assert_array_equal,
-            first_scene_data,
-            second_scene_data,
-        )
+        assert _arrays_differ(
+            first_scene_data, second_scene_data
+        ), "First and second scene data are the same"
 
     check_local_file_not_open(image_container)
     check_can_serialize_image_container(image_container)
@@ -1,8 +1,10 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import pickle
 import typing
 
+import numpy as np
 import pytest
 
 from bioio_base.dimensions import Dimensions
@@ -75,3 +77,59 @@ def test_dimensions_bad_iterable_of_characters(
 ) -> None:
     # Just check success
     assert Dimensions(dims, shape)
+
+
+def test_dimensions_attribute_access() -> None:
+    dims = Dimensions("MTCZYXS", (2, 1, 4, 75, 624, 924, 3))
+    assert (dims.M, dims.T, dims.C, dims.Z, dims.Y, dims.X, dims.S) == dims.shape
+
+    # Non-standard dimensions are still available as attributes
+    dims = Dimensions("ABYX", (5, 6, 624, 924))
+    assert dims.A == 5
+    assert dims.B == 6
+    assert dims.Y == 624
+
+    # Dimensions not present raise like any other missing attribute
+    with pytest.raises(AttributeError):
+        dims.Z
+    with pytest.raises(AttributeError):
+        dims.Q
+    assert getattr(dims, "T", None) is None
+
+
+def test_dimensions_getitem_repeat_and_single_key() -> None:
+    dims = Dimensions("TCZYX", (1, 4, 75, 624, 924))
+
+    # Repeat lookups of the same key are served from the cached getter
+    for _ in range(2):
+        assert dims["Y", "X"] == (624, 924)
+        assert dims[["Z"]] == (75,)
+        assert dims[()] == ()
+
+    with pytest.raises(IndexError):
+        dims["TC"]
+    with pytest.raises(TypeError):
+        dims["T", 0]  # type: ignore
+
+
+def test_dimensions_hashable_and_immutable() -> None:
+    dims = Dimensions("TCZYX", (1, 4, 75, 624, 924))
+    same = Dimensions(["T", "C", "Z", "Y", "X"], (1, 4, 75, 624, 924))
+    assert dims == same
+    assert hash(dims) == hash(same)
+    assert dims != Dimensions("TCZYX", (1, 4, 75, 624, 925))
+    assert len({dims, same}) == 1
+
+    with pytest.raises(AttributeError):
+        dims.X = 10  # type: ignore
+    with pytest.raises(AttributeError):
+        del dims.X
+
+    assert pickle.loads(pickle.dumps(dims)) == dims
+
+
+def test_dimensions_str_subclass_order() -> None:
+    dims = Dimensions(np.str_("YX"), (2, 3))
+    assert dims.order == "YX"
+    assert dims.Y == 2
+    assert dims == Dimensions("YX", (2, 3))
@@ -32,3 +32,22 @@ def test_pathlib_to_fs_with_missing_file(
     uri = tmp_path / "missing-file.txt"
 
     pathlike_to_fs(uri, enforce_exists, fs_kwargs=dict(anon=True))
+
+
+def test_pathlike_to_fs_relative_path_after_chdir(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    (first / "a.txt").write_text("a")
+
+    monkeypatch.chdir(first)
+    _, path = pathlike_to_fs("a.txt", enforce_exists=True)
+    assert path == (first / "a.txt").as_posix()
+
+    # Relative paths resolve against the new working directory
+    monkeypatch.chdir(second)
+    with pytest.raises(FileNotFoundError):
+        pathlike_to_fs("a.txt", enforce_exists=True)
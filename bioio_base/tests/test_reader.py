@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from pathlib import Path
+from typing import List, Tuple, Type, Union
+
+import numpy as np
+import pytest
+import xarray as xr
+from ome_types import OME
+
+from bioio_base import exceptions
+from bioio_base.io import pathlike_to_fs
+from bioio_base.noop_reader import NoopReader
+from bioio_base.types import PathLike
+
+
+@pytest.mark.parametrize(
+    "shape, expected_dim_order",
+    [
+        ((10, 10), "YX"),
+        ((3, 10, 10), "ZYX"),
+        ((2, 3, 4, 10, 10), "TCZYX"),
+    ],
+)
+def test_guess_dim_order(shape: Tuple[int, ...], expected_dim_order: str) -> None:
+    # Run twice to hit the cached path
+    for _ in range(2):
+        assert NoopReader._guess_dim_order(shape) == expected_dim_order
+
+
+def test_set_scene() -> None:
+    reader = NoopReader("noop")
+
+    reader.set_scene("Image:2")
+    assert reader.current_scene_index == 2
+    reader.set_scene("Image:1")
+    assert reader.current_scene_index == 1
+    assert reader.current_scene == "Image:1"
+    reader.set_scene(0)
+    assert reader.current_scene == "Image:0"
+
+    with pytest.raises(IndexError):
+        reader.set_scene("Image:3")
+    with pytest.raises(IndexError):
+        reader.set_scene(3)
+    with pytest.raises(TypeError):
+        reader.set_scene(1.0)  # type: ignore
+
+
+class PyramidNoopReader(NoopReader):
+    @property
+    def resolution_levels(self) -> Tuple[int, ...]:
+        return (0, 1)
+
+    def _read_delayed(self) -> xr.DataArray:
+        data = super()._read_delayed()
+        step = 2**self.current_resolution_level
+        return data[..., ::step, ::step]
+
+
+def test_resolution_level_dims() -> None:
+    reader = NoopReader("noop")
+    data = reader.xarray_dask_data
+
+    # Only the current level is available so nothing is reset
+    assert reader.resolution_level_dims == {0: (4, 5, 6, 7, 8)}
+    assert reader.xarray_dask_data is data
+
+    reader = PyramidNoopReader("noop")
+    reader.set_resolution_level(1)
+    assert reader.resolution_level_dims == {0: (4, 5, 6, 7, 8), 1: (4, 5, 6, 4, 4)}
+    assert reader.current_resolution_level == 1
+    assert reader.shape == (4, 5, 6, 4, 4)
+
+
+@pytest.mark.parametrize(
+    "start, stop, step_size",
+    [
+        (0, 10, 1),
+        (0, 10, 0.1),
+        (3, 1000, 0.108333),
+        (0.5, 10, 2),
+        (0, 10, np.float32(0.1)),
+        (np.uint8(0), np.uint8(200), 2),
+        (np.uint8(0), np.uint8(200), np.uint8(2)),
+    ],
+)
+def test_generate_coord_array(
+    start: Union[int, float], stop: Union[int, float], step_size: Union[int, float]
+) -> None:
+    coords = NoopReader._generate_coord_array(start, stop, step_size)
+    expected = np.arange(start, stop) * step_size
+    assert coords.dtype == expected.dtype
+    np.testing.assert_array_equal(coords, expected)
+
+
+def test_get_image_data_reads_selection_only() -> None:
+    reader = NoopReader("noop")
+
+    # Selection is read from the delayed array without loading the image
+    c1 = reader.get_image_data("ZYX", C=1)
+    assert reader._xarray_data is None
+    np.testing.assert_array_equal(c1, NoopReader._mock_data[0, 0, 1])
+
+    # Once in memory selections come from the in-memory array
+    reader.data
+    np.testing.assert_array_equal(reader.get_image_data("ZYX", C=1), c1)
+
+
+def test_is_supported_image_types(tmp_path: Path) -> None:
+    class PathSubclass(type(Path())):  # type: ignore
+        pass
+
+    image = tmp_path / "image.noop"
+    image.touch()
+
+    supported_images: List[PathLike] = [str(image), image, PathSubclass(image)]
+    for supported in supported_images:
+        assert NoopReader.is_supported_image(supported)
+
+    with pytest.raises(TypeError):
+        NoopReader.is_supported_image(1)  # type: ignore
+
+
+def test_mosaic_requires_tiles() -> None:
+    reader = NoopReader("noop")
+    assert reader.mosaic_tile_dims is None
+
+    with pytest.raises(exceptions.InvalidDimensionOrderingError):
+        reader.mosaic_xarray_dask_data
+    with pytest.raises(exceptions.InvalidDimensionOrderingError):
+        reader.mosaic_data
+
+
+class ChannelNamesNoopReader(NoopReader):
+    def _read_delayed(self) -> xr.DataArray:
+        data = super()._read_delayed()
+        return data.assign_coords(
+            C=[f"Scene{self.current_scene_index}:{c}" for c in range(data.shape[1])]
+        )
+
+
+def test_channel_names() -> None:
+    # Channel dimension without coordinate values
+    assert NoopReader("noop").channel_names == [0, 1, 2, 3, 4]
+
+    reader = ChannelNamesNoopReader("noop")
+    channel_names = reader.channel_names
+    assert channel_names == [f"Scene0:{c}" for c in range(5)]
+
+    # Both branches return the numpy scalars of the coordinate values
+    assert channel_names is not None
+    assert all(isinstance(name, np.str_) for name in channel_names)
+    default_names = NoopReader("noop").channel_names
+    assert default_names is not None
+    assert all(isinstance(name, np.integer) for name in default_names)
+
+    # Mutating the returned list does not change the reader
+    channel_names.append("extra")
+    assert reader.channel_names == [f"Scene0:{c}" for c in range(5)]
+
+    reader.set_scene(1)
+    assert reader.channel_names == [f"Scene1:{c}" for c in range(5)]
+
+
+def test_prefetch(tmp_path: Path) -> None:
+    image = tmp_path / "image.noop"
+    image.write_bytes(bytes(range(100)))
+
+    reader = NoopReader(image)
+    reader._fs, reader._path = pathlike_to_fs(image)
+
+    head, tail = reader._prefetch([(0, 4), (-2, None)])
+    assert head == bytes(range(4))
+    assert tail == bytes([98, 99])
+
+    # Cached ranges are served without reading the file again
+    image.unlink()
+    assert reader._prefetch([(-2, None), (0, 4)]) == [tail, head]
+
+    with pytest.raises(FileNotFoundError):
+        reader._prefetch([(0, 8)])
+
+
+class SceneIndependentMetadataNoopReader(NoopReader):
+    _SCENE_INDEPENDENT_CACHES = NoopReader._SCENE_INDEPENDENT_CACHES | {"_metadata"}
+
+
+@pytest.mark.parametrize(
+    "reader_class, expect_kept",
+    [(NoopReader, False), (SceneIndependentMetadataNoopReader, True)],
+)
+def test_set_scene_keeps_scene_independent_caches(
+    reader_class: Type[NoopReader], expect_kept: bool
+) -> None:
+    reader = reader_class("noop")
+    metadata = reader._metadata = object()
+    data = reader.xarray_dask_data
+
+    reader.set_scene(1)
+    assert (reader._metadata is metadata) is expect_kept
+    assert reader.xarray_dask_data is not data
+
+    # Resolution level changes always reset everything
+    reader = PyramidNoopReader("noop")
+    reader._SCENE_INDEPENDENT_CACHES = frozenset({"_metadata"})
+    reader._metadata = object()
+    reader.set_resolution_level(1)
+    assert reader._metadata is None
+
+
+def test_data_reset_on_scene_change() -> None:
+    reader = NoopReader("noop")
+    assert reader.data is reader.data
+    np.testing.assert_array_equal(reader.data, NoopReader._mock_data[0])
+
+    reader.set_scene(1)
+    np.testing.assert_array_equal(reader.data, NoopReader._mock_data[1])
+
+
+class OMENoopReader(NoopReader):
+    n_transforms = 0
+
+    def _get_ome_metadata(self) -> OME:
+        self.n_transforms += 1
+        return OME()
+
+
+def test_ome_metadata_cached() -> None:
+    with pytest.raises(NotImplementedError):
+        NoopReader("noop").ome_metadata
+
+    reader = OMENoopReader("noop")
+    ome = reader.ome_metadata
+    assert reader.ome_metadata is ome
+
+    # The OME model covers all scenes in the file
+    reader.set_scene(1)
+    assert reader.ome_metadata is ome
+    assert reader.n_transforms == 1
+
+
+def test_in_memory_xarray_dask_data_keeps_coords(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    reader = ChannelNamesNoopReader("noop")
+    monkeypatch.setattr(
+        reader,
+        "_read_immediate",
+        lambda: reader._read_delayed()
+        .assign_coords(label=("C", np.arange(5)))
+        .compute(),
+    )
+    reader.data
+
+    # Single in-memory block with numpy backed coords
+    assert reader.xarray_dask_data.data.numblocks == (1, 1, 1, 1, 1)
+    assert isinstance(reader.xarray_dask_data.coords["label"].data, np.ndarray)
+    assert reader.channel_names == [f"Scene0:{c}" for c in range(5)]
@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable, List, Literal, Mapping, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Literal, Mapping, Optional, Tuple, Union
 
 import dask.array as da
 import numpy as np
@@ -327,6 +327,26 @@ def test_reshape_data_kwargs_values(
     np.testing.assert_array_equal(actual, expected)
 
 
+def test_reshape_data_repeat_selections() -> None:
+    data = np.arange(2 * 3 * 4).reshape((2, 3, 4))
+
+    # Hashable selections reuse a cached plan, lists are planned per call
+    selections: List[Dict[str, Any]] = [{"Z": 1}, {"Z": (0, 1)}, {"Z": [1, 0]}]
+    for other_args in selections:
+        first = transforms.reshape_data(data, "ZYX", "TXZY", **other_args)
+        second = transforms.reshape_data(data, "ZYX", "TXZY", **other_args)
+        np.testing.assert_array_equal(first, second)
+
+    # Equal values of other types are not served from the cached plan
+    transforms.reshape_data(data, "ZYX", "YX", Z=1)
+    with pytest.raises(TypeError):
+        transforms.reshape_data(data, "ZYX", "YX", Z=1.0)
+
+    # The same selection is validated against the shape of each array
+    with pytest.raises(IndexError):
+        transforms.reshape_data(data[:1], "ZYX", "YX", Z=1)
+
+
 @pytest.mark.parametrize(
     "data, given_dims, return_dims, expected_shape",
     [
@@ -498,6 +518,29 @@ def test_generate_stack_mismatch_and_drop(
         np.testing.assert_allclose(stack, reference)
 
 
+class MismatchedNoopReader(noop_reader.NoopReader):
+    def _read_immediate(self) -> xr.DataArray:
+        data = super()._read_immediate()
+        if self.current_scene_index == 1:
+            return data[:-1]
+        return data
+
+
+@pytest.mark.parametrize(
+    "Reader, expected_scenes",
+    [(noop_reader.NoopReader, [0, 1, 2]), (MismatchedNoopReader, [0, 2])],
+)
+def test_generate_stack_drop_releases_buffer(
+    Reader: type[noop_reader.NoopReader], expected_scenes: List[int]
+) -> None:
+    stack = transforms.generate_stack(Reader("noop"), "data", True, None, "I", "index")
+    np.testing.assert_array_equal(stack, Reader._mock_data[expected_scenes])
+
+    # The stack owns its memory rather than viewing a larger buffer
+    assert isinstance(stack, np.ndarray)
+    assert stack.base is None
+
+
 @pytest.mark.parametrize(
     "list_to_test, expected",
     [
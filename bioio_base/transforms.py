@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections import Counter
+from functools import lru_cache
 from numbers import Integral
 from typing import Any, List, Literal, Optional, Tuple, Union
 
@@ -33,6 +34,26 @@ def reduce_to_slice(L: Union[List, Tuple]) -> Union[int, List, slice, Tuple]:
     return L
 
 
+def _get_transposer(given_dims: str, return_dims: str) -> List[int]:
+    # Use a counter to track that the contents are composed of the same letters
+    # and that no letter is repeated
+    if (
+        Counter(given_dims) != Counter(return_dims)
+        or max(Counter(given_dims).values()) > 1
+    ):
+        raise ConflictingArgumentsError(
+            f"given_dims={given_dims} and return_dims={return_dims} are incompatible."
+        )
+
+    # Resort the data into return_dims order
+    match_map = {dim: given_dims.find(dim) for dim in given_dims}
+    transposer = []
+    for dim in return_dims:
+        transposer.append(match_map[dim])
+
+    return transposer
+
+
 def transpose_to_dims(
     data: types.ArrayLike,
     given_dims: str,
@@ -62,63 +83,55 @@ def transpose_to_dims(
     ConflictingArgumentsError
         given_dims and return_dims are incompatible.
     """
-    # Use a counter to track that the contents are composed of the same letters
-    # and that no letter is repeated
-    if (
-        Counter(given_dims) != Counter(return_dims)
-        or max(Counter(given_dims).values()) > 1
-    ):
-        raise ConflictingArgumentsError(
-            f"given_dims={given_dims} and return_dims={return_dims} are incompatible."
-        )
-
-    # Resort the data into return_dims order
-    match_map = {dim: given_dims.find(dim) for dim in given_dims}
-    transposer = []
-    for dim in return_dims:
-        transposer.append(match_map[dim])
-    data = data.transpose(transposer)
+    data = data.transpose(_get_transposer(given_dims, return_dims))
 
     return data
 
 
-def reshape_data(
-    data: types.ArrayLike, given_dims: str, return_dims: str, **kwargs: Any
-) -> types.ArrayLike:
+def _selection_types(selection: Any) -> Any:
+    # The type of a selection and of the values it holds
+    if isinstance(selection, slice):
+        return (
+            slice,
+            type(selection.start),
+            type(selection.stop),
+            type(selection.step),
+        )
+    if isinstance(selection, (list, tuple)):
+        return (type(selection), *(type(value) for value in selection))
+
+    return type(selection)
+
+
+def _plan_reshape(
+    shape: Tuple[int, ...],
+    given_dims: str,
+    return_dims: str,
+    selections: Tuple[Tuple[str, Any, Any], ...],
+) -> Tuple[Tuple[Any, ...], Tuple[int, ...], Tuple[int, ...]]:
     """
-    Reshape the data into return_dims, pad missing dimensions, and prune extra
-    dimensions. Warns the user to use the base reader if the depth of the Dimension
-    being removed is not 1.
+    Resolve the getitem selection, the empty dimension insertions, and the final
+    transpose needed by reshape_data for data of the provided shape.
 
     Parameters
     ----------
-    data: types.ArrayLike
-        Either a dask array or numpy.ndarray of arbitrary shape but with the dimensions
-        specified in given_dims
+    shape: Tuple[int, ...]
+        The shape of the data to reshape.
     given_dims: str
         The dimension ordering of data, "CZYX", "VBTCXZY" etc
     return_dims: str
         The dimension ordering of the return data
-    kwargs:
-        * C=1 => desired specific channel, if C in the input data has depth 3 then C=1
-          returns the 2nd slice (0 indexed)
-        * Z=10 => desired specific channel, if Z in the input data has depth 20 then
-          Z=10 returns the 11th slice
-        * T=[0, 1] => desired specific timepoints, if T in the input data has depth 100
-          then T=[0, 1] returns the 1st and 2nd slice (0 indexed)
-        * T=(0, 1) => desired specific timepoints, if T in the input data has depth 100
-          then T=(0, 1) returns the 1st and 2nd slice (0 indexed)
-        * T=(0, -1) => desired specific timepoints, if T in the input data has depth 100
-          then T=(0, -1) returns the first and last slice
-        * T=range(10) => desired specific timepoints, if T in the input data has depth
-          100 then T=range(10) returns the first ten slices
-        * T=slice(0, -1, 5) => desired specific timepoints, T=slice(0, -1, 5) returns
-          every fifth timepoint
+    selections: Tuple[Tuple[str, Any, Any], ...]
+        The reshape_data kwargs as (dim, selection type key, selection) triples.
 
     Returns
     -------
-    data: types.ArrayLike
-        The data with the specified dimension ordering.
+    dim_specs: Tuple[Any, ...]
+        The getitem selection to apply to the data.
+    expand_indices: Tuple[int, ...]
+        The axis positions, in order, to insert an empty dimension at.
+    transposer: Tuple[int, ...]
+        The axes order to transpose the selected and expanded data by.
 
     Raises
     ------
@@ -128,49 +141,9 @@ def reshape_data(
 
     IndexError
         Requested dimension index not present in data.
-
-    Examples
-    --------
-    Specific index selection
-
-    >>> data = np.random.rand((10, 100, 100))
-    ... z1 = reshape_data(data, "ZYX", "YX", Z=1)
-
-    List of index selection
-
-    >>> data = np.random.rand((10, 100, 100))
-    ... first_and_second = reshape_data(data, "ZYX", "YX", Z=[0, 1])
-
-    Tuple of index selection
-
-    >>> data = np.random.rand((10, 100, 100))
-    ... first_and_last = reshape_data(data, "ZYX", "YX", Z=(0, -1))
-
-    Range of index selection
-
-    >>> data = np.random.rand((10, 100, 100))
-    ... first_three = reshape_data(data, "ZYX", "YX", Z=range(3))
-
-    Slice selection
-
-    >>> data = np.random.rand((10, 100, 100))
-    ... every_other = reshape_data(data, "ZYX", "YX", Z=slice(0, -1, 2))
-
-    Empty dimension expansion
-
-    >>> data = np.random.rand((10, 100, 100))
-    ... with_time = reshape_data(data, "ZYX", "TZYX")
-
-    Dimension order shuffle
-
-    >>> data = np.random.rand((10, 100, 100))
-    ... as_zx_base = reshape_data(data, "ZYX", "YZX")
-
-    Selections, empty dimension expansions, and dimension order shuffle
-
-    >>> data = np.random.rand((10, 100, 100))
-    ... example = reshape_data(data, "CYX", "BSTCZYX", C=slice(0, -1, 3))
     """
+    kwargs = {dim: selection for dim, _, selection in selections}
+
     # Check for parameter conflicts
     for dim in given_dims:
         # return_dims='CZYX' and iterable dimensions 'T=range(10)'
@@ -254,30 +227,152 @@ def reshape_data(
             new_dims = new_dims.replace(dim, "")
 
         # Check that fixed integer request isn't outside of request
-        if check_selection_max > data.shape[dim_index]:
+        if check_selection_max > shape[dim_index]:
             raise IndexError(
                 f"Dimension specified with {dim}={display_dim_spec} "
-                f"but Dimension shape is {data.shape[dim_index]}."
+                f"but Dimension shape is {shape[dim_index]}."
             )
 
         # All checks and operations passed, append dim operation to getitem ops
         dim_specs.append(dim_spec)
 
-    # Run getitems
-    data = data[tuple(dim_specs)]
-
-    # Add empty dims where dimensions were requested but data doesn't exist
     # Add dimensions to new dims where empty dims are added
+    expand_indices = []
     for i, dim in enumerate(return_dims):
         # This dimension wasn't processed
         if dim not in given_dims:
             new_dims = f"{new_dims[:i]}{dim}{new_dims[i:]}"
-            data = data.reshape(*data.shape[:i], 1, *data.shape[i:])
+            expand_indices.append(i)
+
+    return (
+        tuple(dim_specs),
+        tuple(expand_indices),
+        tuple(_get_transposer(new_dims, return_dims)),
+    )
+
+
+# Plans are shared between calls, callers must not mutate them
+_cached_plan_reshape = lru_cache(maxsize=64)(_plan_reshape)
+
+
+def reshape_data(
+    data: types.ArrayLike, given_dims: str, return_dims: str, **kwargs: Any
+) -> types.ArrayLike:
+    """
+    Reshape the data into return_dims, pad missing dimensions, and prune extra
+    dimensions. Warns the user to use the base reader if the depth of the Dimension
+    being removed is not 1.
+
+    Parameters
+    ----------
+    data: types.ArrayLike
+        Either a dask array or numpy.ndarray of arbitrary shape but with the dimensions
+        specified in given_dims
+    given_dims: str
+        The dimension ordering of data, "CZYX", "VBTCXZY" etc
+    return_dims: str
+        The dimension ordering of the return data
+    kwargs:
+        * C=1 => desired specific channel, if C in the input data has depth 3 then C=1
+          returns the 2nd slice (0 indexed)
+        * Z=10 => desired specific channel, if Z in the input data has depth 20 then
+          Z=10 returns the 11th slice
+        * T=[0, 1] => desired specific timepoints, if T in the input data has depth 100
+          then T=[0, 1] returns the 1st and 2nd slice (0 indexed)
+        * T=(0, 1) => desired specific timepoints, if T in the input data has depth 100
+          then T=(0, 1) returns the 1st and 2nd slice (0 indexed)
+        * T=(0, -1) => desired specific timepoints, if T in the input data has depth 100
+          then T=(0, -1) returns the first and last slice
+        * T=range(10) => desired specific timepoints, if T in the input data has depth
+          100 then T=range(10) returns the first ten slices
+        * T=slice(0, -1, 5) => desired specific timepoints, T=slice(0, -1, 5) returns
+          every fifth timepoint
+
+    Returns
+    -------
+    data: types.ArrayLike
+        The data with the specified dimension ordering.
+
+    Raises
+    ------
+    ConflictingArgumentsError
+        Missing dimension in return dims when using range, slice, or multi-index
+        dimension selection for the requested dimension.
+
+    IndexError
+        Requested dimension index not present in data.
+
+    Examples
+    --------
+    Specific index selection
+
+    >>> data = np.random.rand((10, 100, 100))
+    ... z1 = reshape_data(data, "ZYX", "YX", Z=1)
+
+    List of index selection
+
+    >>> data = np.random.rand((10, 100, 100))
+    ... first_and_second = reshape_data(data, "ZYX", "YX", Z=[0, 1])
+
+    Tuple of index selection
+
+    >>> data = np.random.rand((10, 100, 100))
+    ... first_and_last = reshape_data(data, "ZYX", "YX", Z=(0, -1))
+
+    Range of index selection
+
+    >>> data = np.random.rand((10, 100, 100))
+    ... first_three = reshape_data(data, "ZYX", "YX", Z=range(3))
+
+    Slice selection
+
+    >>> data = np.random.rand((10, 100, 100))
+    ... every_other = reshape_data(data, "ZYX", "YX", Z=slice(0, -1, 2))
+
+    Empty dimension expansion
+
+    >>> data = np.random.rand((10, 100, 100))
+    ... with_time = reshape_data(data, "ZYX", "TZYX")
+
+    Dimension order shuffle
+
+    >>> data = np.random.rand((10, 100, 100))
+    ... as_zx_base = reshape_data(data, "ZYX", "YZX")
+
+    Selections, empty dimension expansions, and dimension order shuffle
+
+    >>> data = np.random.rand((10, 100, 100))
+    ... example = reshape_data(data, "CYX", "BSTCZYX", C=slice(0, -1, 3))
+    """
+    # Reuse the selection plan for repeated requests on the same shape
+    # Unhashable selections (lists, slices on older Pythons) are planned each call
+    # Selections are keyed with their types as well, equal values of different
+    # types (1, 1.0, True) are validated differently
+    plan_key = (
+        tuple(data.shape),
+        given_dims,
+        return_dims,
+        tuple(
+            (dim, _selection_types(selection), selection)
+            for dim, selection in sorted(kwargs.items())
+        ),
+    )
+    try:
+        hash(plan_key)
+    except TypeError:
+        dim_specs, expand_indices, transposer = _plan_reshape(*plan_key)
+    else:
+        dim_specs, expand_indices, transposer = _cached_plan_reshape(*plan_key)
+
+    # Run getitems
+    data = data[dim_specs]
+
+    # Add empty dims where dimensions were requested but data doesn't exist
+    for i in expand_indices:
+        data = data.reshape(*data.shape[:i], 1, *data.shape[i:])
 
     # Any extra dimensions have been removed, only a problem if the depth is > 1
-    return transpose_to_dims(
-        data, given_dims=new_dims, return_dims=return_dims
-    )  # don't pass kwargs or 2 copies
+    return data.transpose(transposer)
 
 
 def generate_stack(
@@ -340,7 +435,12 @@ def generate_stack(
         )
 
     scene_stacks = []
-    scene_names = []
+    scene_names: List[str] = []
+
+    # In-memory scenes are copied into a preallocated output as they are read so
+    # only one scene is held alongside the stack instead of every scene at once
+    in_memory = "dask" not in mode
+    out: Optional[np.ndarray] = None
 
     if select_scenes is None:
         select_scenes = list(range(len(image_container.scenes)))
@@ -356,6 +456,9 @@ def generate_stack(
             shape = data.shape
             dtype = data.dtype
 
+            if in_memory:
+                out = np.empty((len(select_scenes), *shape), dtype=dtype)
+
             if "xarray" in mode:
                 coords = dict(data.coords)
                 dims = data.dims
@@ -387,13 +490,25 @@ def generate_stack(
                 else:
                     continue
 
-        scene_stacks.append(data)
+        if out is not None:
+            out[len(scene_names)] = data
+        else:
+            scene_stacks.append(data)
         scene_names.append(image_container.current_scene)
 
     stack = da.stack if "dask" in mode else np.stack
 
-    if "xarray" in mode:
+    if out is not None:
+        # Copy out the kept scenes so the space left by dropped scenes is released
+        all_data = out
+        if len(scene_names) < len(select_scenes):
+            all_data = out[: len(scene_names)].copy()
+    elif "xarray" in mode:
         all_data = stack([x.data for x in scene_stacks])
+    else:
+        all_data = stack(scene_stacks)
+
+    if "xarray" in mode:
         if scene_coord_values == "names":
             coords = {scene_character: scene_names, **coords}
 
@@ -404,4 +519,4 @@ def generate_stack(
         )
 
     else:
-        return stack(scene_stacks)
+        return all_data